@@ -1,4 +1,16 @@
 import os
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8)
+def _default_persistence_dir(_home: str | None, _userprofile: str | None) -> str:
+    """Resolve ~/.openhands once per home directory.
+
+    expanduser may hit the password database, so the result is memoized. It
+    reads HOME on POSIX and USERPROFILE on Windows, so both values are part of
+    the cache key and tests that override either still see the updated path.
+    """
+    return os.path.expanduser("~/.openhands")
 
 
 def get_persistence_dir() -> str:
@@ -6,8 +18,11 @@ def get_persistence_dir() -> str:
 
     Can be overridden via OPENHANDS_PERSISTENCE_DIR environment variable.
     """
-    return os.environ.get(
-        "OPENHANDS_PERSISTENCE_DIR", os.path.expanduser("~/.openhands")
+    persistence_dir = os.environ.get("OPENHANDS_PERSISTENCE_DIR")
+    if persistence_dir is not None:
+        return persistence_dir
+    return _default_persistence_dir(
+        os.environ.get("HOME"), os.environ.get("USERPROFILE")
     )
 
 
@@ -16,10 +31,10 @@ def get_conversations_dir() -> str:
 
     Can be overridden via OPENHANDS_CONVERSATIONS_DIR environment variable.
     """
-    return os.environ.get(
-        "OPENHANDS_CONVERSATIONS_DIR",
-        os.path.join(get_persistence_dir(), "conversations"),
-    )
+    conversations_dir = os.environ.get("OPENHANDS_CONVERSATIONS_DIR")
+    if conversations_dir is not None:
+        return conversations_dir
+    return os.path.join(get_persistence_dir(), "conversations")
 
 
 def get_work_dir() -> str:
@@ -27,7 +42,10 @@ def get_work_dir() -> str:
 
     Can be overridden via OPENHANDS_WORK_DIR environment variable.
     """
-    return os.environ.get("OPENHANDS_WORK_DIR", os.getcwd())
+    work_dir = os.environ.get("OPENHANDS_WORK_DIR")
+    if work_dir is not None:
+        return work_dir
+    return os.getcwd()
 
 
 # Static configuration values (don't need to be dynamic)
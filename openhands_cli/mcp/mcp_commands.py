@@ -5,9 +5,11 @@ through the command line interface.
 """
 
 import argparse
+from collections.abc import Callable
 
 from fastmcp.mcp_config import RemoteMCPServer, StdioMCPServer
 from rich.console import Console
+from rich.text import Text
 
 from openhands_cli.mcp.mcp_display_utils import mask_sensitive_value
 from openhands_cli.mcp.mcp_utils import (
@@ -25,6 +27,14 @@ from openhands_cli.theme import OPENHANDS_THEME
 
 console = Console()
 
+_DEFAULT_COLOR = "#ffffff"
+
+# Static section labels, built once instead of re-parsing markup per server
+_HEADERS_LABEL = Text("    Headers:", style=OPENHANDS_THEME.secondary or _DEFAULT_COLOR)
+_ENVIRONMENT_LABEL = Text(
+    "    Environment:", style=OPENHANDS_THEME.secondary or _DEFAULT_COLOR
+)
+
 
 def handle_mcp_add(args: argparse.Namespace) -> None:
     """Handle the 'mcp add' command.
@@ -99,9 +109,13 @@ def handle_mcp_list(_args: argparse.Namespace) -> None:
         )
         console.print()
 
-        for name, server in servers.items():
-            _render_server_details(name, server)
-            console.print()
+        # Emit every server block in one write rather than line by line
+        console.print(
+            Text("\n\n").join(
+                _format_server_details(name, server) for name, server in servers.items()
+            )
+        )
+        console.print()
 
     except MCPConfigurationError as e:
         console.print(f"Error: {e}", style=OPENHANDS_THEME.error)
@@ -119,66 +133,93 @@ def handle_mcp_get(args: argparse.Namespace) -> None:
 
         console.print(f"MCP server '{args.name}':", style=OPENHANDS_THEME.foreground)
         console.print()
-        _render_server_details(args.name, server, show_name=False)
+        console.print(_format_server_details(args.name, server, show_name=False))
 
     except MCPConfigurationError as e:
         console.print(f"Error: {e}", style=OPENHANDS_THEME.error)
         raise SystemExit(1)
 
 
-def _render_server_details(
+def _render_row(text: str, style: str = "") -> Text:
+    """Render one detail row as console.print would, without parsing markup.
+
+    Keeps rich's default highlighting (URLs, numbers, paths, KEY=) while
+    letting rows be collected into a single printable block.
+    """
+    row = console.render_str(text, markup=False)
+    # Highlighting returns a fresh Text, so apply the base style afterwards
+    row.style = style
+    return row
+
+
+def _format_server_details(
     name: str, server: StdioMCPServer | RemoteMCPServer, show_name: bool = True
-) -> None:
-    """Render server configuration details.
+) -> Text:
+    """Format server configuration details as a single renderable.
+
+    Lines are collected into one Text so each server is printed with a single
+    console call instead of one call per field.
 
     Args:
         name: Server name
         server: Server object
         show_name: Whether to show the server name
+
+    Returns:
+        Styled text block describing the server
     """
+    secondary = OPENHANDS_THEME.secondary or _DEFAULT_COLOR
+    lines: list[Text] = []
+
     if show_name:
         # Show enabled/disabled status
         enabled = is_server_enabled(name)
         status = "✓ enabled" if enabled else "✗ disabled"
-        status_style = OPENHANDS_THEME.success if enabled else OPENHANDS_THEME.warning
-        console.print(f"  • {name}", style=OPENHANDS_THEME.accent, end="")
-        console.print(f" [{status}]", style=status_style)
+        status_style = (
+            OPENHANDS_THEME.success if enabled else OPENHANDS_THEME.warning
+        ) or _DEFAULT_COLOR
+        status_line = _render_row(
+            f"  • {name}", OPENHANDS_THEME.accent or _DEFAULT_COLOR
+        )
+        status_line.append_text(_render_row(f" [{status}]", status_style))
+        lines.append(status_line)
 
-    console.print(f"    Transport: {server.transport}", style=OPENHANDS_THEME.secondary)
+    lines.append(_render_row(f"    Transport: {server.transport}", secondary))
 
-    # Show authentication method if specified (only for RemoteMCPServer)
-    if isinstance(server, RemoteMCPServer) and server.auth:
-        console.print(
-            f"    Authentication: {server.auth}", style=OPENHANDS_THEME.secondary
-        )
+    match server:
+        case StdioMCPServer():
+            if server.command:
+                lines.append(_render_row(f"    Command: {server.command}", secondary))
 
-    if isinstance(server, RemoteMCPServer):
-        if server.url:
-            console.print(f"    URL: {server.url}", style=OPENHANDS_THEME.secondary)
+            if server.args:
+                args_str = " ".join(server.args)
+                lines.append(_render_row(f"    Arguments: {args_str}", secondary))
 
-        if server.headers:
-            console.print("    Headers:", style=OPENHANDS_THEME.secondary)
-            for key, value in server.headers.items():
-                # Mask potential sensitive values
-                display_value = mask_sensitive_value(key, value)
-                console.print(f"      {key}: {display_value}")
+            if server.env:
+                lines.append(_ENVIRONMENT_LABEL)
+                for key, value in server.env.items():
+                    # Mask potential sensitive values
+                    display_value = mask_sensitive_value(key, value)
+                    lines.append(_render_row(f"      {key}={display_value}"))
 
-    elif isinstance(server, StdioMCPServer):
-        if server.command:
-            console.print(
-                f"    Command: {server.command}", style=OPENHANDS_THEME.secondary
-            )
+        case RemoteMCPServer():
+            # Authentication is only available on remote servers
+            if server.auth:
+                lines.append(
+                    _render_row(f"    Authentication: {server.auth}", secondary)
+                )
+
+            if server.url:
+                lines.append(_render_row(f"    URL: {server.url}", secondary))
 
-        if server.args:
-            args_str = " ".join(server.args)
-            console.print(f"    Arguments: {args_str}", style=OPENHANDS_THEME.secondary)
+            if server.headers:
+                lines.append(_HEADERS_LABEL)
+                for key, value in server.headers.items():
+                    # Mask potential sensitive values
+                    display_value = mask_sensitive_value(key, value)
+                    lines.append(_render_row(f"      {key}: {display_value}"))
 
-        if server.env:
-            console.print("    Environment:", style=OPENHANDS_THEME.secondary)
-            for key, value in server.env.items():
-                # Mask potential sensitive values
-                display_value = mask_sensitive_value(key, value)
-                console.print(f"      {key}={display_value}")
+    return Text("\n").join(lines)
 
 
 def handle_mcp_enable(args: argparse.Namespace) -> None:
@@ -223,24 +264,24 @@ def handle_mcp_disable(args: argparse.Namespace) -> None:
         raise SystemExit(1)
 
 
+_MCP_COMMAND_HANDLERS: dict[str, Callable[[argparse.Namespace], None]] = {
+    "add": handle_mcp_add,
+    "remove": handle_mcp_remove,
+    "list": handle_mcp_list,
+    "get": handle_mcp_get,
+    "enable": handle_mcp_enable,
+    "disable": handle_mcp_disable,
+}
+
+
 def handle_mcp_command(args: argparse.Namespace) -> None:
     """Main handler for MCP commands.
 
     Args:
         args: Parsed command line arguments
     """
-    if args.mcp_command == "add":
-        handle_mcp_add(args)
-    elif args.mcp_command == "remove":
-        handle_mcp_remove(args)
-    elif args.mcp_command == "list":
-        handle_mcp_list(args)
-    elif args.mcp_command == "get":
-        handle_mcp_get(args)
-    elif args.mcp_command == "enable":
-        handle_mcp_enable(args)
-    elif args.mcp_command == "disable":
-        handle_mcp_disable(args)
-    else:
+    handler = _MCP_COMMAND_HANDLERS.get(args.mcp_command)
+    if handler is None:
         console.print("Unknown MCP command", style=OPENHANDS_THEME.error)
         raise SystemExit(1)
+    handler(args)
@@ -4,11 +4,29 @@ This module provides shared utilities for formatting MCP server
 configuration details across different display contexts (CLI, TUI, etc.).
 """
 
+import re
 from typing import Any
 
 from fastmcp.mcp_config import RemoteMCPServer, StdioMCPServer
 
 
+_SENSITIVE_KEY_PATTERN = re.compile(
+    "|".join(
+        (
+            "authorization",
+            "bearer",
+            "token",
+            "key",
+            "secret",
+            "password",
+            "api_key",
+            "apikey",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+
 def normalize_server_object(
     server: StdioMCPServer | RemoteMCPServer | dict[str, Any],
 ) -> StdioMCPServer | RemoteMCPServer:
@@ -55,19 +73,7 @@ def mask_sensitive_value(key: str, value: str) -> str:
     Returns:
         Masked value if sensitive, original value otherwise
     """
-    sensitive_keys = {
-        "authorization",
-        "bearer",
-        "token",
-        "key",
-        "secret",
-        "password",
-        "api_key",
-        "apikey",
-    }
-
-    key_lower = key.lower()
-    if any(sensitive in key_lower for sensitive in sensitive_keys):
+    if _SENSITIVE_KEY_PATTERN.search(key):
         if len(value) <= 8:
             return "*" * len(value)
         else:
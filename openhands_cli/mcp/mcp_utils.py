@@ -4,6 +4,7 @@ This module provides functionality to manage MCP server configurations
 similar to Claude's MCP command line interface.
 """
 
+import json
 from pathlib import Path
 from typing import Any, Literal, cast
 
@@ -30,6 +31,35 @@ class MCPConfigurationError(Exception):
     pass
 
 
+# Parsed configurations keyed by file path, tagged with the (mtime_ns, size)
+# of the file they were read from so unchanged files are not parsed again
+_config_cache: dict[Path, tuple[tuple[int, int], MCPConfig]] = {}
+
+
+def _get_config_stamp(config_path: Path) -> tuple[int, int] | None:
+    """Get the (mtime_ns, size) stamp of the config file.
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        The file stamp, or None if the file doesn't exist
+    """
+    try:
+        stat = config_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _get_cached_config(config_path: Path, stamp: tuple[int, int]) -> MCPConfig | None:
+    """Return the cached configuration if the file hasn't changed since parsing."""
+    cached = _config_cache.get(config_path)
+    if cached is None or cached[0] != stamp:
+        return None
+    return cached[1]
+
+
 def _ensure_config_dir(config_path: Path) -> None:
     """Ensure the configuration directory exists.
 
@@ -42,6 +72,10 @@ def _ensure_config_dir(config_path: Path) -> None:
 def load_mcp_config() -> MCPConfig:
     """Load the MCP configuration from file.
 
+    The parsed configuration is cached until the file changes and the same
+    object is returned to every caller, so treat it as read-only. Code that
+    modifies the configuration should go through _load_mcp_config_for_update.
+
     Returns:
         The MCPConfig object, or empty config if file doesn't exist.
 
@@ -50,17 +84,36 @@ def load_mcp_config() -> MCPConfig:
         ValidationError: If the configuration format is invalid.
     """
     config_path = _get_mcp_config_path()
-    if not config_path.exists():
+    stamp = _get_config_stamp(config_path)
+    if stamp is None:
         # Return empty config with mcpServers structure
         return MCPConfig.from_dict({"mcpServers": {}})
 
-    try:
-        return MCPConfig.from_file(config_path)
-    except (ValueError, PydanticValidationError) as e:
-        # Re-raise as MCPConfigurationError for consistency
-        raise MCPConfigurationError(f"Invalid MCP configuration file: {e}") from e
-    except Exception as e:
-        raise MCPConfigurationError(f"Error reading config file: {e}") from e
+    config = _get_cached_config(config_path, stamp)
+    if config is None:
+        try:
+            config = MCPConfig.from_file(config_path)
+        except (ValueError, PydanticValidationError) as e:
+            # Re-raise as MCPConfigurationError for consistency
+            raise MCPConfigurationError(f"Invalid MCP configuration file: {e}") from e
+        except Exception as e:
+            raise MCPConfigurationError(f"Error reading config file: {e}") from e
+        _config_cache[config_path] = (stamp, config)
+
+    return config
+
+
+def _load_mcp_config_for_update() -> MCPConfig:
+    """Load the MCP configuration as a copy that is safe to modify.
+
+    Only the server mapping is copied: updates replace or add server
+    objects rather than mutating the cached ones in place.
+
+    Returns:
+        A copy of the MCPConfig with its own mcpServers dict.
+    """
+    config = load_mcp_config()
+    return config.model_copy(update={"mcpServers": dict(config.mcpServers)})
 
 
 def save_mcp_config(config: MCPConfig) -> None:
@@ -74,6 +127,7 @@ def save_mcp_config(config: MCPConfig) -> None:
     """
     try:
         config_path = _get_mcp_config_path()
+        _config_cache.pop(config_path, None)
         _ensure_config_dir(config_path)
         config.write_to_file(config_path)
     except Exception as e:
@@ -157,7 +211,7 @@ def add_server(
     Raises:
         MCPConfigurationError: If configuration is invalid or server already exists
     """
-    config = load_mcp_config()
+    config = _load_mcp_config_for_update()
 
     # Check if server already exists
     if name in config.mcpServers:
@@ -224,12 +278,35 @@ def list_servers() -> dict[str, StdioMCPServer | RemoteMCPServer]:
         Dictionary of server objects keyed by name
     """
     config = load_mcp_config()
-    return config.mcpServers
+    return dict(config.mcpServers)
+
+
+def _read_config_data(config_path: Path) -> Any:
+    """Read the raw JSON content of the MCP configuration file.
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        The decoded JSON document
+
+    Raises:
+        MCPConfigurationError: If the file cannot be read or is not valid JSON.
+    """
+    try:
+        return json.loads(config_path.read_text())
+    except ValueError as e:
+        raise MCPConfigurationError(f"Invalid MCP configuration file: {e}") from e
+    except Exception as e:
+        raise MCPConfigurationError(f"Error reading config file: {e}") from e
 
 
 def get_server(name: str) -> StdioMCPServer | RemoteMCPServer:
     """Get configuration for a specific MCP server.
 
+    Only the requested entry is validated, so looking up one server does not
+    build model objects for every other server in the file.
+
     Args:
         name: Name of the MCP server
 
@@ -239,13 +316,35 @@ def get_server(name: str) -> StdioMCPServer | RemoteMCPServer:
     Raises:
         MCPConfigurationError: If server doesn't exist
     """
-    config = load_mcp_config()
-    servers = config.mcpServers
+    config_path = _get_mcp_config_path()
+    stamp = _get_config_stamp(config_path)
+    if stamp is None:
+        raise MCPConfigurationError(f"MCP server '{name}' not found")
+
+    cached_config = _get_cached_config(config_path, stamp)
+    if cached_config is not None:
+        if name not in cached_config.mcpServers:
+            raise MCPConfigurationError(f"MCP server '{name}' not found")
+        return cached_config.mcpServers[name]
+
+    data = _read_config_data(config_path)
+    raw_servers = data.get("mcpServers") if isinstance(data, dict) else None
 
-    if name not in servers:
+    if not isinstance(raw_servers, dict):
+        # Uncommon layouts (e.g. servers at the root) need full validation
+        servers = load_mcp_config().mcpServers
+        if name not in servers:
+            raise MCPConfigurationError(f"MCP server '{name}' not found")
+        return servers[name]
+
+    if name not in raw_servers:
         raise MCPConfigurationError(f"MCP server '{name}' not found")
 
-    return servers[name]
+    try:
+        config = MCPConfig.from_dict({"mcpServers": {name: raw_servers[name]}})
+    except (ValueError, PydanticValidationError) as e:
+        raise MCPConfigurationError(f"Invalid MCP configuration file: {e}") from e
+    return config.mcpServers[name]
 
 
 def enable_server(name: str) -> None:
@@ -257,7 +356,7 @@ def enable_server(name: str) -> None:
     Raises:
         MCPConfigurationError: If server doesn't exist
     """
-    config = load_mcp_config()
+    config = _load_mcp_config_for_update()
 
     # Check if server exists
     if name not in config.mcpServers:
@@ -293,7 +392,7 @@ def disable_server(name: str) -> None:
     Raises:
         MCPConfigurationError: If server doesn't exist
     """
-    config = load_mcp_config()
+    config = _load_mcp_config_for_update()
 
     # Check if server exists
     if name not in config.mcpServers:
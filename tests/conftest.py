@@ -1,15 +1,24 @@
+from __future__ import annotations
+
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 from pydantic import SecretStr
 
-from openhands.sdk import LLM, Agent
 from openhands_cli.locations import AGENT_SETTINGS_PATH
-from openhands_cli.utils import get_default_cli_agent
 
 
-@dataclass
+# The SDK is imported inside the helpers that build agents so that collecting
+# tests which never touch an agent (e.g. parser tests) doesn't pay for it
+if TYPE_CHECKING:
+    from openhands.sdk import Agent
+
+
+@dataclass(slots=True)
 class MockLocations:
     """Typed container for mock location paths used in tests."""
 
@@ -24,6 +33,45 @@ class MockLocations:
 # =============================================================================
 
 
+def _dump_agent_json(agent: Agent, *, expose_secrets: bool) -> str:
+    """Serialize an agent to the agent_settings.json format.
+
+    Args:
+        agent: Agent to serialize
+        expose_secrets: Whether to include secret values in the output
+
+    Returns:
+        The agent as a JSON string
+    """
+    context = {"expose_secrets": True} if expose_secrets else None
+    return agent.model_dump_json(context=context)
+
+
+@lru_cache(maxsize=32)
+def _default_agent_config_json(
+    model: str, api_key: str, base_url: str | None, expose_secrets: bool
+) -> str:
+    """Build and serialize the default CLI agent for the given LLM settings.
+
+    The default agent depends only on these inputs, so the JSON is built once
+    per combination and reused by every test that asks for the same config.
+    """
+    from openhands.sdk import LLM
+    from openhands_cli.utils import get_default_cli_agent
+
+    llm_kwargs = {
+        "model": model,
+        "api_key": SecretStr(api_key),
+        "usage_id": "test-agent",
+    }
+    if base_url:
+        llm_kwargs["base_url"] = base_url
+
+    llm = LLM(**llm_kwargs)
+    agent = get_default_cli_agent(llm=llm)
+    return _dump_agent_json(agent, expose_secrets=expose_secrets)
+
+
 def save_test_agent(
     persistence_dir: Path,
     *,
@@ -48,13 +96,15 @@ def save_test_agent(
     Returns:
         The created Agent instance
     """
+    from openhands.sdk import LLM, Agent
+
     agent = Agent(
         llm=LLM(model=model, api_key=SecretStr(api_key), usage_id="test"),
         tools=tools if tools is not None else [],
         mcp_config=mcp_config if mcp_config is not None else {},
     )
     (persistence_dir / AGENT_SETTINGS_PATH).write_text(
-        agent.model_dump_json(context={"expose_secrets": True})
+        _dump_agent_json(agent, expose_secrets=True)
     )
     return agent
 
@@ -83,23 +133,10 @@ def create_test_agent_config(
     Returns:
         Path to the created agent_settings.json file
     """
-    llm_kwargs = {
-        "model": model,
-        "api_key": SecretStr(api_key),
-        "usage_id": "test-agent",
-    }
-    if base_url:
-        llm_kwargs["base_url"] = base_url
-
-    llm = LLM(**llm_kwargs)
-    agent = get_default_cli_agent(llm=llm)
-
     agent_settings_path = persistence_dir / "agent_settings.json"
-    if expose_secrets:
-        config_json = agent.model_dump_json(context={"expose_secrets": True})
-    else:
-        config_json = agent.model_dump_json()
-    agent_settings_path.write_text(config_json)
+    agent_settings_path.write_text(
+        _default_agent_config_json(model, api_key, base_url, expose_secrets)
+    )
 
     return agent_settings_path
 
@@ -143,14 +180,13 @@ def temp_config_path(monkeypatch, tmp_path):
 # Fixture: mock_locations - Standardized location mocking via environment variables
 @pytest.fixture
 def mock_locations(tmp_path_factory, monkeypatch) -> MockLocations:
-    """Set up mock locations using environment variables and mock expanduser.
+    """Set up mock locations using environment variables.
 
     Mocks:
     - OPENHANDS_PERSISTENCE_DIR, OPENHANDS_CONVERSATIONS_DIR, OPENHANDS_WORK_DIR
-    - os.path.expanduser("~") returns home_dir
+    - HOME (and USERPROFILE on Windows) so os.path.expanduser("~") returns
+      home_dir without intercepting every expanduser call
     """
-    import os.path
-
     home_dir = tmp_path_factory.mktemp("home")
     persistence_dir = home_dir / ".openhands"
     persistence_dir.mkdir(exist_ok=True)
@@ -162,18 +198,9 @@ def mock_locations(tmp_path_factory, monkeypatch) -> MockLocations:
     monkeypatch.setenv("OPENHANDS_CONVERSATIONS_DIR", str(conversations_dir))
     monkeypatch.setenv("OPENHANDS_WORK_DIR", str(work_dir))
 
-    original_expanduser = os.path.expanduser
-
-    def mock_expanduser(path):
-        if path == "~":
-            return str(home_dir)
-        elif path.startswith("~/"):
-            return str(home_dir / path[2:])
-        elif path.startswith("~"):
-            return original_expanduser(path)
-        return path
-
-    monkeypatch.setattr("os.path.expanduser", mock_expanduser)
+    monkeypatch.setenv("HOME", str(home_dir))
+    if sys.platform == "win32":
+        monkeypatch.setenv("USERPROFILE", str(home_dir))
 
     return MockLocations(
         persistence_dir=persistence_dir,
@@ -2,12 +2,15 @@
 
 import argparse
 import tempfile
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from fastmcp.mcp_config import RemoteMCPServer, StdioMCPServer
+from rich.text import Text
 
+from openhands_cli.mcp import mcp_commands
 from openhands_cli.mcp.mcp_commands import (
+    _MCP_COMMAND_HANDLERS,
     handle_mcp_add,
     handle_mcp_command,
     handle_mcp_disable,
@@ -231,6 +234,55 @@ class TestMCPCommands:
                 content = " ".join(call_args_list)
                 assert "test_server" in content
 
+    def test_handle_mcp_get_renders_details_in_one_call(self):
+        """Test that server details are printed once and rows are verbatim."""
+        args = argparse.Namespace(name="test_server")
+
+        test_server = StdioMCPServer(
+            transport="stdio",
+            command="python",
+            env={"PATTERN": "[bold]literal[/bold]"},
+        )
+
+        with patch("openhands_cli.mcp.mcp_commands.get_server") as mock_get_server:
+            mock_get_server.return_value = test_server
+
+            with patch("openhands_cli.mcp.mcp_commands.console.print") as mock_print:
+                handle_mcp_get(args)
+
+                details = mock_print.call_args_list[-1].args[0]
+                assert isinstance(details, Text)
+                assert details.plain.splitlines() == [
+                    "    Transport: stdio",
+                    "    Command: python",
+                    "    Environment:",
+                    "      PATTERN=[bold]literal[/bold]",
+                ]
+
+    def test_handle_mcp_get_remote_without_explicit_transport(self):
+        """Test that remote servers with an inferred transport show their URL."""
+        args = argparse.Namespace(name="test_server")
+
+        test_server = RemoteMCPServer(url="https://api.example.com/mcp", auth="oauth")
+
+        with patch("openhands_cli.mcp.mcp_commands.get_server") as mock_get_server:
+            mock_get_server.return_value = test_server
+
+            with patch("openhands_cli.mcp.mcp_commands.console.print") as mock_print:
+                handle_mcp_get(args)
+
+                details = mock_print.call_args_list[-1].args[0]
+                assert details.plain.splitlines() == [
+                    "    Transport: None",
+                    "    Authentication: oauth",
+                    "    URL: https://api.example.com/mcp",
+                ]
+                # Rows keep rich's default highlighting, as console.print did
+                url_spans = [s for s in details.spans if s.style == "repr.url"]
+                assert [details.plain[s.start : s.end] for s in url_spans] == [
+                    "https://api.example.com/mcp"
+                ]
+
     def test_handle_mcp_get_error(self):
         """Test getting non-existent server."""
         args = argparse.Namespace(name="nonexistent")
@@ -373,12 +425,17 @@ class TestMCPCommands:
         for command, handler_name in test_cases:
             args = argparse.Namespace(mcp_command=command)
 
-            with patch(
-                f"openhands_cli.mcp.mcp_commands.{handler_name}"
-            ) as mock_handler:
+            mock_handler = MagicMock()
+            with patch.dict(
+                "openhands_cli.mcp.mcp_commands._MCP_COMMAND_HANDLERS",
+                {command: mock_handler},
+            ):
                 handle_mcp_command(args)
                 mock_handler.assert_called_once_with(args)
 
+            # The dispatch table must point at the public handler
+            assert _MCP_COMMAND_HANDLERS[command] is getattr(mcp_commands, handler_name)
+
     def test_handle_mcp_command_unknown(self):
         """Test handling unknown MCP command."""
         args = argparse.Namespace(mcp_command="unknown")
@@ -1,18 +1,36 @@
 """Minimal high-impact tests for MCP argument parser help functionality."""
 
 import argparse
-import io
-from contextlib import redirect_stderr
 
 import pytest
 
 from openhands_cli.argparsers.mcp_parser import MCPArgumentParser, add_mcp_parser
 
 
+@pytest.fixture(scope="module")
+def main_parser() -> argparse.ArgumentParser:
+    """Top-level parser with the MCP subcommands, built once per module.
+
+    parse_args does not mutate the parser, so it is safe to share.
+    """
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command")
+    add_mcp_parser(subparsers)
+    return parser
+
+
+@pytest.fixture(scope="module")
+def cli_parser() -> argparse.ArgumentParser:
+    """Full CLI parser from create_main_parser, built once per module."""
+    from openhands_cli.argparsers.main_parser import create_main_parser
+
+    return create_main_parser()
+
+
 class TestMCPParserErrorHandling:
     """High-impact tests focusing on error handling and help display."""
 
-    def test_custom_error_method_shows_full_help(self):
+    def test_custom_error_method_shows_full_help(self, capsys):
         """Test that the custom error method shows full help instead of just usage."""
         parser = MCPArgumentParser(
             description="Test parser with examples",
@@ -21,16 +39,11 @@ class TestMCPParserErrorHandling:
         parser.add_argument("--required", required=True, help="A required argument")
         parser.add_argument("positional", help="A positional argument")
 
-        stderr_capture = io.StringIO()
-
-        with redirect_stderr(stderr_capture):
-            with pytest.raises(SystemExit) as exc_info:
-                parser.parse_args(
-                    ["--required", "value"]
-                )  # Missing positional argument
+        with pytest.raises(SystemExit) as exc_info:
+            parser.parse_args(["--required", "value"])  # Missing positional argument
 
         assert exc_info.value.code == 2
-        output = stderr_capture.getvalue()
+        output = capsys.readouterr().err
         assert "usage:" in output
         assert "Test parser with examples" in output
         assert "Error: the following arguments are required: positional" in output
@@ -53,21 +66,14 @@ class TestMCPParserErrorHandling:
         ],
     )
     def test_missing_arguments_show_full_help_with_examples(
-        self, command, missing_args, expected_error
+        self, capsys, main_parser, command, missing_args, expected_error
     ):
         """Test that missing required arguments show full help with examples."""
-        main_parser = argparse.ArgumentParser()
-        subparsers = main_parser.add_subparsers(dest="command")
-        add_mcp_parser(subparsers)
-
-        stderr_capture = io.StringIO()
-
-        with redirect_stderr(stderr_capture):
-            with pytest.raises(SystemExit) as exc_info:
-                main_parser.parse_args(["mcp", command] + missing_args)
+        with pytest.raises(SystemExit) as exc_info:
+            main_parser.parse_args(["mcp", command] + missing_args)
 
         assert exc_info.value.code == 2
-        output = stderr_capture.getvalue()
+        output = capsys.readouterr().err
 
         # Verify full help is shown with examples
         assert "usage:" in output
@@ -90,61 +96,40 @@ class TestMCPParserErrorHandling:
         ],
     )
     def test_invalid_arguments_show_full_help_with_examples(
-        self, command, invalid_args, expected_error_pattern
+        self, capsys, main_parser, command, invalid_args, expected_error_pattern
     ):
         """Test that invalid argument values show full help with examples."""
-        main_parser = argparse.ArgumentParser()
-        subparsers = main_parser.add_subparsers(dest="command")
-        add_mcp_parser(subparsers)
-
-        stderr_capture = io.StringIO()
-
-        with redirect_stderr(stderr_capture):
-            with pytest.raises(SystemExit) as exc_info:
-                main_parser.parse_args(["mcp", command] + invalid_args)
+        with pytest.raises(SystemExit) as exc_info:
+            main_parser.parse_args(["mcp", command] + invalid_args)
 
         assert exc_info.value.code == 2
-        output = stderr_capture.getvalue()
+        output = capsys.readouterr().err
 
         # Verify full help is shown with examples
         assert "usage:" in output
         assert "Examples:" in output
         assert expected_error_pattern in output
 
-    def test_unrecognized_argument_shows_mcp_help(self):
+    def test_unrecognized_argument_shows_mcp_help(self, capsys, main_parser):
         """Test that unrecognized arguments (like --url) show MCP help with examples."""
-        main_parser = argparse.ArgumentParser()
-        subparsers = main_parser.add_subparsers(dest="command")
-        add_mcp_parser(subparsers)
-
-        stderr_capture = io.StringIO()
-
-        with redirect_stderr(stderr_capture):
-            with pytest.raises(SystemExit) as exc_info:
-                # This reproduces the original issue: --url instead of positional target
-                main_parser.parse_args(["mcp", "add", "--url", "https://example.com"])
+        with pytest.raises(SystemExit) as exc_info:
+            # This reproduces the original issue: --url instead of positional target
+            main_parser.parse_args(["mcp", "add", "--url", "https://example.com"])
 
         assert exc_info.value.code == 2
-        output = stderr_capture.getvalue()
+        output = capsys.readouterr().err
 
         # Should show MCP-specific help with examples
         assert "Examples:" in output
         assert "Add a new MCP server configuration" in output
         assert "Error:" in output
 
-    def test_mcp_add_examples_content(self):
+    def test_mcp_add_examples_content(self, capsys, main_parser):
         """Test that MCP add command shows comprehensive examples on error."""
-        main_parser = argparse.ArgumentParser()
-        subparsers = main_parser.add_subparsers(dest="command")
-        add_mcp_parser(subparsers)
-
-        stderr_capture = io.StringIO()
-
-        with redirect_stderr(stderr_capture):
-            with pytest.raises(SystemExit):
-                main_parser.parse_args(["mcp", "add"])  # Missing all required args
+        with pytest.raises(SystemExit):
+            main_parser.parse_args(["mcp", "add"])  # Missing all required args
 
-        output = stderr_capture.getvalue()
+        output = capsys.readouterr().err
 
         # Verify key examples are present
         expected_examples = [
@@ -175,12 +160,8 @@ class TestMCPParserErrorHandling:
         assert mcp_subparsers_action is not None
         assert mcp_subparsers_action._parser_class == MCPArgumentParser
 
-    def test_successful_parsing_still_works(self):
+    def test_successful_parsing_still_works(self, main_parser):
         """Test that valid arguments still parse successfully (no regression)."""
-        main_parser = argparse.ArgumentParser()
-        subparsers = main_parser.add_subparsers(dest="command")
-        add_mcp_parser(subparsers)
-
         # This should not raise an exception
         args = main_parser.parse_args(
             ["mcp", "add", "--transport", "http", "server-name", "https://example.com"]
@@ -261,12 +242,9 @@ class TestMCPParserErrorHandling:
         ),
     ],
 )
-def test_stdio_command_with_double_dash_comprehensive(cli_args, expected):
+def test_stdio_command_with_double_dash_comprehensive(cli_parser, cli_args, expected):
     """Test various stdio MCP add scenarios with -- separator."""
-    from openhands_cli.argparsers.main_parser import create_main_parser
-
-    parser = create_main_parser()
-    args = parser.parse_args(cli_args)
+    args = cli_parser.parse_args(cli_args)
 
     assert args.command == "mcp"
     assert args.mcp_command == "add"
@@ -323,12 +301,9 @@ def test_stdio_command_with_double_dash_comprehensive(cli_args, expected):
         ),
     ],
 )
-def test_stdio_edge_cases_and_error_handling(cli_args, expected):
+def test_stdio_edge_cases_and_error_handling(cli_parser, cli_args, expected):
     """Test edge cases around the -- separator for stdio commands."""
-    from openhands_cli.argparsers.main_parser import create_main_parser
-
-    parser = create_main_parser()
-    args = parser.parse_args(cli_args)
+    args = cli_parser.parse_args(cli_args)
 
     assert args.command == "mcp"
     assert args.mcp_command == "add"
@@ -338,24 +313,18 @@ def test_stdio_edge_cases_and_error_handling(cli_args, expected):
     assert args.args == expected["args"]
 
 
-def test_mcp_enable_subcommand():
+def test_mcp_enable_subcommand(cli_parser):
     """Test that enable subcommand parses correctly."""
-    from openhands_cli.argparsers.main_parser import create_main_parser
-
-    parser = create_main_parser()
-    args = parser.parse_args(["mcp", "enable", "test_server"])
+    args = cli_parser.parse_args(["mcp", "enable", "test_server"])
 
     assert args.command == "mcp"
     assert args.mcp_command == "enable"
     assert args.name == "test_server"
 
 
-def test_mcp_disable_subcommand():
+def test_mcp_disable_subcommand(cli_parser):
     """Test that disable subcommand parses correctly."""
-    from openhands_cli.argparsers.main_parser import create_main_parser
-
-    parser = create_main_parser()
-    args = parser.parse_args(["mcp", "disable", "test_server"])
+    args = cli_parser.parse_args(["mcp", "disable", "test_server"])
 
     assert args.command == "mcp"
     assert args.mcp_command == "disable"
@@ -402,12 +371,9 @@ def test_mcp_disable_subcommand():
         ),
     ],
 )
-def test_mcp_add_enabled_disabled_flags(cli_args, expected_enabled):
+def test_mcp_add_enabled_disabled_flags(cli_parser, cli_args, expected_enabled):
     """Test that --enabled and --disabled flags on add command work correctly."""
-    from openhands_cli.argparsers.main_parser import create_main_parser
-
-    parser = create_main_parser()
-    args = parser.parse_args(cli_args)
+    args = cli_parser.parse_args(cli_args)
 
     assert args.command == "mcp"
     assert args.mcp_command == "add"
@@ -415,35 +381,21 @@ def test_mcp_add_enabled_disabled_flags(cli_args, expected_enabled):
     assert args.enabled == expected_enabled
 
 
-def test_enable_subcommand_missing_name_shows_error():
+def test_enable_subcommand_missing_name_shows_error(capsys, main_parser):
     """Test that missing name for enable command shows proper error."""
-    main_parser = argparse.ArgumentParser()
-    subparsers = main_parser.add_subparsers(dest="command")
-    add_mcp_parser(subparsers)
-
-    stderr_capture = io.StringIO()
-
-    with redirect_stderr(stderr_capture):
-        with pytest.raises(SystemExit) as exc_info:
-            main_parser.parse_args(["mcp", "enable"])
+    with pytest.raises(SystemExit) as exc_info:
+        main_parser.parse_args(["mcp", "enable"])
 
     assert exc_info.value.code == 2
-    output = stderr_capture.getvalue()
+    output = capsys.readouterr().err
     assert "Error: the following arguments are required: name" in output
 
 
-def test_disable_subcommand_missing_name_shows_error():
+def test_disable_subcommand_missing_name_shows_error(capsys, main_parser):
     """Test that missing name for disable command shows proper error."""
-    main_parser = argparse.ArgumentParser()
-    subparsers = main_parser.add_subparsers(dest="command")
-    add_mcp_parser(subparsers)
-
-    stderr_capture = io.StringIO()
-
-    with redirect_stderr(stderr_capture):
-        with pytest.raises(SystemExit) as exc_info:
-            main_parser.parse_args(["mcp", "disable"])
+    with pytest.raises(SystemExit) as exc_info:
+        main_parser.parse_args(["mcp", "disable"])
 
     assert exc_info.value.code == 2
-    output = stderr_capture.getvalue()
+    output = capsys.readouterr().err
     assert "Error: the following arguments are required: name" in output
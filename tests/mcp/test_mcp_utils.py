@@ -1,9 +1,10 @@
 """Unit tests for MCP configuration management."""
 
 import json
+from unittest.mock import patch
 
 import pytest
-from fastmcp.mcp_config import RemoteMCPServer, StdioMCPServer
+from fastmcp.mcp_config import MCPConfig, RemoteMCPServer, StdioMCPServer
 
 from openhands_cli.mcp.mcp_utils import (
     MCPConfigurationError,
@@ -65,6 +66,65 @@ class TestMCPFunctions:
         with pytest.raises(MCPConfigurationError):
             load_mcp_config()
 
+    def test_load_config_reuses_parse_for_unchanged_file(self, temp_config_path):
+        """Test that an unchanged config file is parsed only once."""
+        test_config = {
+            "mcpServers": {"test_server": {"command": "test", "transport": "stdio"}}
+        }
+        temp_config_path.write_text(json.dumps(test_config))
+
+        with patch.object(
+            MCPConfig, "from_file", wraps=MCPConfig.from_file
+        ) as mock_from_file:
+            first = load_mcp_config()
+            second = load_mcp_config()
+
+        assert mock_from_file.call_count == 1
+        # Read-only callers share the cached config instead of a copy
+        assert first is second
+
+    def test_config_updates_do_not_leak_into_earlier_results(self, temp_config_path):
+        """Test that mutators work on a copy of the shared cached config."""
+        temp_config_path.write_text(
+            json.dumps(
+                {
+                    "mcpServers": {
+                        "a": {"command": "a", "transport": "stdio", "enabled": True}
+                    }
+                }
+            )
+        )
+        before = load_mcp_config()
+        server_before = before.mcpServers["a"]
+
+        disable_server("a")
+        add_server("b", "stdio", "b")
+
+        assert set(before.mcpServers) == {"a"}
+        assert before.mcpServers["a"] is server_before
+        assert server_before.model_dump()["enabled"] is True
+        assert set(load_mcp_config().mcpServers) == {"a", "b"}
+        assert is_server_enabled("a") is False
+
+    def test_load_config_picks_up_external_changes(self, temp_config_path):
+        """Test that edits to the file invalidate the cached config."""
+        temp_config_path.write_text(
+            json.dumps({"mcpServers": {"a": {"command": "a", "transport": "stdio"}}})
+        )
+        assert set(load_mcp_config().mcpServers) == {"a"}
+
+        temp_config_path.write_text(
+            json.dumps(
+                {
+                    "mcpServers": {
+                        "a": {"command": "a", "transport": "stdio"},
+                        "b": {"command": "b", "transport": "stdio"},
+                    }
+                }
+            )
+        )
+        assert set(load_mcp_config().mcpServers) == {"a", "b"}
+
     def test_add_server_stdio(self, temp_config_path):
         """Test adding a stdio MCP server."""
         add_server(
@@ -188,6 +248,40 @@ class TestMCPFunctions:
         with pytest.raises(MCPConfigurationError, match="not found"):
             get_server("nonexistent")
 
+    def test_get_server_ignores_other_invalid_entries(self, temp_config_path):
+        """Test that a lookup only validates the requested server."""
+        test_config = {
+            "mcpServers": {
+                "good": {"command": "python", "transport": "stdio"},
+                "broken": {"transport": "stdio"},
+            }
+        }
+        temp_config_path.write_text(json.dumps(test_config))
+
+        server = get_server("good")
+
+        assert isinstance(server, StdioMCPServer)
+        assert server.command == "python"
+        with pytest.raises(MCPConfigurationError, match="Invalid"):
+            get_server("broken")
+
+    def test_get_server_root_level_servers(self, temp_config_path):
+        """Test lookup when servers are defined without an mcpServers key."""
+        test_config = {"root": {"url": "https://example.com", "transport": "http"}}
+        temp_config_path.write_text(json.dumps(test_config))
+
+        server = get_server("root")
+
+        assert isinstance(server, RemoteMCPServer)
+        assert server.url == "https://example.com"
+
+    def test_get_server_invalid_json(self, temp_config_path):
+        """Test getting a server from a malformed config file."""
+        temp_config_path.write_text("invalid json content")
+
+        with pytest.raises(MCPConfigurationError, match="Invalid"):
+            get_server("test")
+
     def test_server_exists_true(self, temp_config_path):
         """Test server_exists returns True for existing server."""
         add_server("test", "http", "https://example.com")
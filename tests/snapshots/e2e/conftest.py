@@ -160,42 +160,73 @@ def e2e_test_environment(
 # =============================================================================
 
 
-@pytest.fixture
-def mock_llm_setup(
-    e2e_test_environment: E2ETestEnvironment,
-) -> Generator[dict[str, Any], None, None]:
-    """Fixture that sets up mock LLM server with default trajectory.
+@pytest.fixture(scope="session")
+def mock_llm_server() -> Generator[MockLLMServer, None, None]:
+    """Session-wide mock LLM server shared by all e2e tests.
 
-    Uses 'simple_echo_hello_world' trajectory for deterministic replay.
-    Returns a dict including 'conversation_id' that should be passed to OpenHandsApp.
+    The server is started once and each test swaps in its own trajectory
+    via MockLLMServer.set_trajectory(), which also resets replay.
     """
-    trajectory = load_trajectory(get_trajectories_dir() / "simple_echo_hello_world")
-    server = MockLLMServer(trajectory=trajectory)
-    base_url = server.start()
+    server = MockLLMServer()
+    server.start()
+
+    yield server
+
+    server.stop()
+
+
+def setup_mock_llm(
+    server: MockLLMServer,
+    env: E2ETestEnvironment,
+    trajectory_name: str,
+) -> dict[str, Any]:
+    """Point the shared mock server at a trajectory and write agent settings.
+
+    Returns:
+        Dict with test paths, the mock server URL, the loaded trajectory and
+        the 'conversation_id' that should be passed to OpenHandsApp.
+    """
+    trajectory = load_trajectory(get_trajectories_dir() / trajectory_name)
+    server.set_trajectory(trajectory)
 
     create_test_agent_config(
-        e2e_test_environment.persistence_dir,
+        env.persistence_dir,
         model="openai/gpt-4o",
-        base_url=base_url,
+        base_url=server.base_url,
         expose_secrets=True,
     )
 
-    yield {
-        "persistence_dir": e2e_test_environment.persistence_dir,
-        "conversations_dir": e2e_test_environment.conversations_dir,
-        "mock_server_url": base_url,
-        "work_dir": e2e_test_environment.work_dir,
+    return {
+        "persistence_dir": env.persistence_dir,
+        "conversations_dir": env.conversations_dir,
+        "mock_server_url": server.base_url,
+        "work_dir": env.work_dir,
         "trajectory": trajectory,
-        "conversation_id": e2e_test_environment.conversation_id,
+        "conversation_id": env.conversation_id,
     }
 
-    server.stop()
+
+@pytest.fixture
+def mock_llm_setup(
+    e2e_test_environment: E2ETestEnvironment,
+    mock_llm_server: MockLLMServer,
+) -> dict[str, Any]:
+    """Fixture that sets up mock LLM server with default trajectory.
+
+    Uses 'simple_echo_hello_world' trajectory for deterministic replay.
+    Returns a dict including 'conversation_id' that should be passed to OpenHandsApp.
+    """
+    return setup_mock_llm(
+        mock_llm_server, e2e_test_environment, "simple_echo_hello_world"
+    )
 
 
 @pytest.fixture
 def mock_llm_with_trajectory(
-    e2e_test_environment: E2ETestEnvironment, request: pytest.FixtureRequest
-) -> Generator[dict[str, Any], None, None]:
+    e2e_test_environment: E2ETestEnvironment,
+    mock_llm_server: MockLLMServer,
+    request: pytest.FixtureRequest,
+) -> dict[str, Any]:
     """Fixture that sets up mock LLM server with a specified trajectory.
 
     Usage:
@@ -208,28 +239,9 @@ def mock_llm_with_trajectory(
     """
     trajectory_name = getattr(request, "param", "simple_echo_hello_world")
 
-    trajectory = load_trajectory(get_trajectories_dir() / trajectory_name)
-    server = MockLLMServer(trajectory=trajectory)
-    base_url = server.start()
-
-    create_test_agent_config(
-        e2e_test_environment.persistence_dir,
-        model="openai/gpt-4o",
-        base_url=base_url,
-        expose_secrets=True,
-    )
-
-    yield {
-        "persistence_dir": e2e_test_environment.persistence_dir,
-        "conversations_dir": e2e_test_environment.conversations_dir,
-        "mock_server_url": base_url,
-        "work_dir": e2e_test_environment.work_dir,
-        "trajectory": trajectory,
-        "trajectory_name": trajectory_name,
-        "conversation_id": e2e_test_environment.conversation_id,
-    }
-
-    server.stop()
+    setup = setup_mock_llm(mock_llm_server, e2e_test_environment, trajectory_name)
+    setup["trajectory_name"] = trajectory_name
+    return setup
 
 
 @pytest.fixture
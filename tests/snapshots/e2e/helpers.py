@@ -73,9 +73,11 @@ async def wait_for_idle(pilot: "Pilot", timeout: float = 30.0) -> None:
 async def type_text(pilot: "Pilot", text: str) -> None:
     """Type text character by character.
 
+    All characters are handed to a single pilot.press() call so Textual can
+    process them as one batch instead of one awaited round-trip per key.
+
     Args:
         pilot: The Textual pilot instance
         text: The text to type
     """
-    for char in text:
-        await pilot.press(char)
+    await pilot.press(*text)
@@ -23,6 +23,18 @@ class TestDirectorySeparation:
         # They should be different
         assert get_work_dir() != get_persistence_dir()
 
+    def test_default_persistence_dir_follows_home(self, monkeypatch, tmp_path):
+        """Test that the cached default persistence dir follows the home dir."""
+        monkeypatch.delenv("OPENHANDS_PERSISTENCE_DIR", raising=False)
+        first_home = tmp_path / "first"
+        second_home = tmp_path / "second"
+
+        # expanduser reads HOME on POSIX and USERPROFILE on Windows
+        for home in (first_home, second_home):
+            monkeypatch.setenv("HOME", str(home))
+            monkeypatch.setenv("USERPROFILE", str(home))
+            assert os.path.normpath(get_persistence_dir()) == str(home / ".openhands")
+
     def test_agent_store_uses_persistence_dir(self):
         """Test that AgentStore uses get_persistence_dir() for file storage."""
         agent_store = AgentStore()
@@ -24,53 +24,87 @@ Usage:
 
 from __future__ import annotations
 
+import itertools
 import json
-import threading
 import time
-import uuid
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
-from pytest_httpserver import HTTPServer
-from werkzeug import Request, Response
-
 
 if TYPE_CHECKING:
+    from pytest_httpserver import HTTPServer
+    from werkzeug import Request, Response
+
     from .trajectory import Trajectory, TrajectoryEvent
 
 
 # Default mock token usage for all responses
 DEFAULT_USAGE = {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}
 
+# Response ids only need to be unique within a run, so a counter is enough
+_id_counter = itertools.count(1)
+
+
+def _next_id() -> str:
+    """Return a fresh 24-character hex id for completions and tool calls."""
+    return f"{next(_id_counter):024x}"
+
+
+@dataclass(frozen=True)
+class PrebuiltResponse:
+    """Serialized response bodies for a single replayed LLM call.
+
+    The SDK does not stream by default, so the SSE body is only encoded
+    the first time a streaming request asks for it.
+    """
+
+    completion_body: bytes
+    stream_chunks: list[dict[str, Any]]
 
-@dataclass
+    @classmethod
+    def from_response(cls, response: dict[str, Any]) -> PrebuiltResponse:
+        """Serialize the completion of a converted response."""
+        return cls(
+            completion_body=json.dumps(response["completion"]).encode(),
+            stream_chunks=response["stream_chunks"],
+        )
+
+    @cached_property
+    def sse_body(self) -> bytes:
+        """Encoded Server-Sent Events body, built on first use."""
+        return _format_sse_response(self.stream_chunks)
+
+
+@dataclass(slots=True)
 class TrajectoryReplayState:
-    """Tracks the state of trajectory replay across requests."""
+    """Tracks the state of trajectory replay across requests.
+
+    No locking is needed: the HTTPServer is not threaded, so requests are
+    handled one at a time on the server thread.
+    """
 
-    responses: list[TrajectoryEvent] = field(default_factory=list)
+    responses: list[PrebuiltResponse] = field(default_factory=list)
     current_index: int = 0
-    _lock: threading.Lock = field(default_factory=threading.Lock)
 
-    def get_next_response(self) -> TrajectoryEvent | None:
+    def get_next_response(self) -> PrebuiltResponse | None:
         """Get the next response to replay, advancing the index."""
-        with self._lock:
-            if self.current_index >= len(self.responses):
-                return None
-            response = self.responses[self.current_index]
-            self.current_index += 1
-            return response
-
-    def peek_next_response(self) -> TrajectoryEvent | None:
+        if self.current_index >= len(self.responses):
+            return None
+        response = self.responses[self.current_index]
+        self.current_index += 1
+        return response
+
+    def peek_next_response(self) -> PrebuiltResponse | None:
         """Peek at the next response without advancing."""
-        with self._lock:
-            if self.current_index >= len(self.responses):
-                return None
-            return self.responses[self.current_index]
+        if self.current_index >= len(self.responses):
+            return None
+        return self.responses[self.current_index]
 
     def reset(self) -> None:
         """Reset replay to the beginning."""
-        with self._lock:
-            self.current_index = 0
+        self.current_index = 0
 
 
 class OpenAIResponseBuilder:
@@ -81,12 +115,13 @@ class OpenAIResponseBuilder:
         completion_id: str,
         message: dict[str, Any],
         finish_reason: str = "stop",
+        created: int | None = None,
     ) -> dict[str, Any]:
         """Build a chat completion response."""
         return {
             "id": completion_id,
             "object": "chat.completion",
-            "created": int(time.time()),
+            "created": int(time.time()) if created is None else created,
             "model": "mock-llm",
             "choices": [
                 {"index": 0, "message": message, "finish_reason": finish_reason}
@@ -99,32 +134,50 @@ class OpenAIResponseBuilder:
         completion_id: str,
         delta: dict[str, Any],
         finish_reason: str | None = None,
+        created: int | None = None,
     ) -> dict[str, Any]:
         """Build a single streaming chunk."""
         return {
             "id": completion_id,
             "object": "chat.completion.chunk",
-            "created": int(time.time()),
+            "created": int(time.time()) if created is None else created,
             "model": "mock-llm",
             "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
         }
 
     @classmethod
     def build_message_chunks(
-        cls, completion_id: str, content: str, finish_reason: str = "stop"
+        cls,
+        completion_id: str,
+        content: str,
+        finish_reason: str = "stop",
+        created: int | None = None,
     ) -> list[dict[str, Any]]:
         """Build streaming chunks for a text message response."""
+        if created is None:
+            created = int(time.time())
         return [
-            cls.build_stream_chunk(completion_id, {"role": "assistant", "content": ""}),
-            cls.build_stream_chunk(completion_id, {"content": content}),
-            cls.build_stream_chunk(completion_id, {}, finish_reason),
+            cls.build_stream_chunk(
+                completion_id, {"role": "assistant", "content": ""}, created=created
+            ),
+            cls.build_stream_chunk(
+                completion_id, {"content": content}, created=created
+            ),
+            cls.build_stream_chunk(completion_id, {}, finish_reason, created),
         ]
 
     @classmethod
     def build_tool_call_chunks(
-        cls, completion_id: str, tool_call_id: str, tool_name: str, arguments: str
+        cls,
+        completion_id: str,
+        tool_call_id: str,
+        tool_name: str,
+        arguments: str,
+        created: int | None = None,
     ) -> list[dict[str, Any]]:
         """Build streaming chunks for a tool call response."""
+        if created is None:
+            created = int(time.time())
         return [
             cls.build_stream_chunk(
                 completion_id,
@@ -140,12 +193,14 @@ class OpenAIResponseBuilder:
                         }
                     ],
                 },
+                created=created,
             ),
             cls.build_stream_chunk(
                 completion_id,
                 {"tool_calls": [{"index": 0, "function": {"arguments": arguments}}]},
+                created=created,
             ),
-            cls.build_stream_chunk(completion_id, {}, "tool_calls"),
+            cls.build_stream_chunk(completion_id, {}, "tool_calls", created),
         ]
 
 
@@ -168,13 +223,16 @@ class TrajectoryResponseConverter:
         This is intentionally public as it's used by external handlers when
         the trajectory replay state has no more events to replay.
         """
-        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        completion_id = f"chatcmpl-{_next_id()}"
+        created = int(time.time())
         return {
             "completion": OpenAIResponseBuilder.build_completion(
-                completion_id, {"role": "assistant", "content": content}
+                completion_id,
+                {"role": "assistant", "content": content},
+                created=created,
             ),
             "stream_chunks": OpenAIResponseBuilder.build_message_chunks(
-                completion_id, content
+                completion_id, content, created=created
             ),
         }
 
@@ -184,10 +242,11 @@ class TrajectoryResponseConverter:
         if not tool_call:
             return self.create_default_response()
 
-        tool_call_id = tool_call.get("id", f"call_{uuid.uuid4().hex[:24]}")
+        tool_call_id = tool_call.get("id", f"call_{_next_id()}")
         tool_name = tool_call.get("name", event.tool_name or "unknown")
         arguments = tool_call.get("arguments", "{}")
-        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        completion_id = f"chatcmpl-{_next_id()}"
+        created = int(time.time())
 
         message: dict[str, Any] = {
             "role": "assistant",
@@ -203,10 +262,10 @@ class TrajectoryResponseConverter:
 
         return {
             "completion": OpenAIResponseBuilder.build_completion(
-                completion_id, message, "tool_calls"
+                completion_id, message, "tool_calls", created
             ),
             "stream_chunks": OpenAIResponseBuilder.build_tool_call_chunks(
-                completion_id, tool_call_id, tool_name, arguments
+                completion_id, tool_call_id, tool_name, arguments, created
             ),
         }
 
@@ -216,15 +275,18 @@ class TrajectoryResponseConverter:
         if not llm_message:
             return self.create_default_response()
 
-        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        completion_id = f"chatcmpl-{_next_id()}"
+        created = int(time.time())
         content = self._extract_content(llm_message)
 
         return {
             "completion": OpenAIResponseBuilder.build_completion(
-                completion_id, {"role": "assistant", "content": content}
+                completion_id,
+                {"role": "assistant", "content": content},
+                created=created,
             ),
             "stream_chunks": OpenAIResponseBuilder.build_message_chunks(
-                completion_id, content
+                completion_id, content, created=created
             ),
         }
 
@@ -235,6 +297,12 @@ class TrajectoryResponseConverter:
         if isinstance(content, str):
             return content
         if isinstance(content, list):
+            # Most messages carry a single text item, so skip the join for it
+            if len(content) == 1:
+                item = content[0]
+                if isinstance(item, dict) and item.get("type") == "text":
+                    return item.get("text", "")
+                return ""
             return "".join(
                 item.get("text", "")
                 for item in content
@@ -242,79 +310,100 @@ class TrajectoryResponseConverter:
             )
         return ""
 
+    def prebuild(self, events: list[TrajectoryEvent]) -> list[PrebuiltResponse]:
+        """Convert and serialize trajectory events ahead of replay."""
+        return [PrebuiltResponse.from_response(self.convert_event(e)) for e in events]
+
 
-def _format_sse_response(chunks: list[dict[str, Any]]) -> str:
-    """Format chunks as Server-Sent Events response."""
+def _format_sse_response(chunks: list[dict[str, Any]]) -> bytes:
+    """Format chunks as an encoded Server-Sent Events response body."""
     lines = [f"data: {json.dumps(chunk)}\n\n" for chunk in chunks]
     lines.append("data: [DONE]\n\n")
-    return "".join(lines)
+    return "".join(lines).encode()
 
 
 def create_request_handler(
     replay_state: TrajectoryReplayState,
-    converter: TrajectoryResponseConverter,
+    default_response: PrebuiltResponse,
 ):
-    """Create a request handler function for pytest-httpserver."""
+    """Create a request handler function for pytest-httpserver.
 
-    def handler(request: Request) -> Response:
-        """Handle all incoming requests."""
-        path = request.path
+    A single catch-all handler is registered with the server and routes on
+    (method, path) with one dict lookup. pytest-httpserver's own per-path
+    matchers are scanned linearly in Python for every request, and an
+    unmatched request would get its generic 500 response instead of the
+    JSON 404 below.
+    """
+    from werkzeug import Response
 
-        # Health check
-        if path in ("/health", "/") and request.method == "GET":
-            remaining = len(replay_state.responses) - replay_state.current_index
-            return Response(
-                json.dumps(
-                    {
-                        "status": "ok",
-                        "server": "mock-llm-trajectory",
-                        "responses_remaining": remaining,
-                    }
-                ),
-                content_type="application/json",
-            )
+    reset_body = json.dumps({"status": "reset"}).encode()
+    invalid_json_body = json.dumps({"error": "Invalid JSON"}).encode()
+    not_found_body = json.dumps({"error": "Not found"}).encode()
 
-        # Reset endpoint
-        if path == "/reset" and request.method == "GET":
-            replay_state.reset()
+    def health(_request: Request) -> Response:
+        """Report server status and how many responses remain."""
+        remaining = len(replay_state.responses) - replay_state.current_index
+        return Response(
+            json.dumps(
+                {
+                    "status": "ok",
+                    "server": "mock-llm-trajectory",
+                    "responses_remaining": remaining,
+                }
+            ),
+            content_type="application/json",
+        )
+
+    def reset(_request: Request) -> Response:
+        """Restart trajectory replay from the beginning."""
+        replay_state.reset()
+        return Response(
+            reset_body,
+            content_type="application/json",
+        )
+
+    def chat_completions(request: Request) -> Response:
+        """Replay the next trajectory response as a chat completion."""
+        try:
+            request_data = json.loads(request.data)
+        except json.JSONDecodeError:
             return Response(
-                json.dumps({"status": "reset"}),
+                invalid_json_body,
+                status=400,
                 content_type="application/json",
             )
 
-        # Chat completions
-        chat_paths = ("/chat/completions", "/v1/chat/completions")
-        if path in chat_paths and request.method == "POST":
-            try:
-                request_data = json.loads(request.data)
-            except json.JSONDecodeError:
-                return Response(
-                    json.dumps({"error": "Invalid JSON"}),
-                    status=400,
-                    content_type="application/json",
-                )
-
-            stream = request_data.get("stream", False)
-            event = replay_state.get_next_response()
-            if event is None:
-                response = converter.create_default_response()
-            else:
-                response = converter.convert_event(event)
-
-            if stream:
-                return Response(
-                    _format_sse_response(response["stream_chunks"]),
-                    content_type="text/event-stream",
-                    headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
-                )
+        stream = request_data.get("stream", False)
+        response = replay_state.get_next_response() or default_response
+
+        if stream:
             return Response(
-                json.dumps(response["completion"]),
-                content_type="application/json",
+                response.sse_body,
+                content_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
             )
+        return Response(
+            response.completion_body,
+            content_type="application/json",
+        )
+
+    routes: dict[tuple[str, str], Callable[[Request], Response]] = {
+        ("GET", "/"): health,
+        ("GET", "/health"): health,
+        ("GET", "/reset"): reset,
+        ("POST", "/chat/completions"): chat_completions,
+        ("POST", "/v1/chat/completions"): chat_completions,
+    }
+
+    def handler(request: Request) -> Response:
+        """Handle all incoming requests."""
+        route = routes.get((request.method, request.path))
+        if route is not None:
+            return route(request)
 
         # Not found
         return Response(
-            json.dumps({"error": "Not found"}),
+            not_found_body,
             status=404,
             content_type="application/json",
         )
@@ -356,13 +445,20 @@ class MockLLMServer:
         Returns:
             The base URL of the server (e.g., http://127.0.0.1:8123)
         """
-        # Create replay state from trajectory
-        responses = self.trajectory.get_llm_responses() if self.trajectory else []
-        self._replay_state = TrajectoryReplayState(responses=responses)
+        # Create replay state from trajectory, serializing every response
+        # up front so requests only have to pick the next prebuilt body
+        self._replay_state = TrajectoryReplayState(
+            responses=self._prebuild_responses(self.trajectory)
+        )
+        default_response = PrebuiltResponse.from_response(
+            self._converter.create_default_response()
+        )
+
+        from pytest_httpserver import HTTPServer
 
         # Create and configure server
         self._server = HTTPServer(host=self.host, port=self.port)
-        handler = create_request_handler(self._replay_state, self._converter)
+        handler = create_request_handler(self._replay_state, default_response)
         self._server.expect_request("").respond_with_handler(handler)
         self._server.start()
 
@@ -382,6 +478,28 @@ class MockLLMServer:
         if self._replay_state:
             self._replay_state.reset()
 
+    def set_trajectory(self, trajectory: Trajectory | None) -> None:
+        """Swap in a new trajectory without restarting the HTTP listener.
+
+        The request handler keeps a reference to the replay state, so the
+        state is updated in place and replay restarts from the beginning.
+
+        Args:
+            trajectory: Trajectory to replay, or None for default responses.
+        """
+        self.trajectory = trajectory
+        if self._replay_state:
+            self._replay_state.responses = self._prebuild_responses(trajectory)
+            self._replay_state.reset()
+
+    def _prebuild_responses(
+        self, trajectory: Trajectory | None
+    ) -> list[PrebuiltResponse]:
+        """Build the serialized responses to replay for a trajectory."""
+        if trajectory is None:
+            return []
+        return self._converter.prebuild(trajectory.get_llm_responses())
+
     def __enter__(self) -> MockLLMServer:
         self.start()
         return self
@@ -17,6 +17,7 @@ The mock LLM server only needs to replay:
 
 import json
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
@@ -80,9 +81,12 @@ class TrajectoryEvent:
         return ""
 
 
-@dataclass
+@dataclass(frozen=True)
 class Trajectory:
-    """A complete agent trajectory for e2e testing."""
+    """A complete agent trajectory for e2e testing.
+
+    Loaded trajectories are shared between callers, so treat them as read-only.
+    """
 
     name: str
     path: Path
@@ -100,13 +104,21 @@ class Trajectory:
 def load_trajectory(trajectory_path: Path | str) -> Trajectory:
     """Load a trajectory from a directory of event JSON files.
 
+    Each directory is parsed once per process; later calls return the same
+    Trajectory object.
+
     Args:
         trajectory_path: Path to directory containing event-XXXXX-*.json files
 
     Returns:
         Trajectory object with parsed events
     """
-    path = Path(trajectory_path)
+    return _load_trajectory(Path(trajectory_path).resolve())
+
+
+@lru_cache(maxsize=32)
+def _load_trajectory(path: Path) -> Trajectory:
+    """Parse the trajectory at an absolute path (memoized by load_trajectory)."""
     if not path.is_dir():
         raise ValueError(f"Trajectory path must be a directory: {path}")
 